@@ -1,5 +1,6 @@
 import argparse
 import os
+import stat
 import sys
 from pathlib import Path
 
@@ -51,6 +52,12 @@ Examples:
             action='store_true',
             help='Enable debug mode for verbose output'
         )
+        
+        self.parser.add_argument(
+            '--yes', '-y',
+            action='store_true',
+            help='Start the analysis without waiting for confirmation'
+        )
     
     def parse_args(self):
         """Parse and validate arguments"""
@@ -64,9 +71,16 @@ Examples:
         
         return args
     
+    def _stat(self, path):
+        """Return os.stat() of path, or None if it cannot be accessed"""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+    
     def _validate_evidence_path(self, evidence_path):
         """Validate evidence directory exists and is accessible"""
-        if not os.path.exists(evidence_path):
+        if self._stat(evidence_path) is None:
             self._error(f"Evidence directory does not exist: {evidence_path}")
         
         if not os.access(evidence_path, os.R_OK):
@@ -74,10 +88,11 @@ Examples:
     
     def _validate_hash_db_path(self, hash_db_path):
         """Validate hash database file exists and is accessible"""
-        if not os.path.exists(hash_db_path):
+        st = self._stat(hash_db_path)
+        if st is None:
             self._error(f"Hash database file does not exist: {hash_db_path}")
         
-        if not os.path.isfile(hash_db_path):
+        if not stat.S_ISREG(st.st_mode):
             self._error(f"Hash database path is not a file: {hash_db_path}")
         
         if not os.access(hash_db_path, os.R_OK):
@@ -99,13 +114,14 @@ Examples:
         if not output_dir:
             output_dir = '.'
         
-        if not os.path.exists(output_dir):
+        st = self._stat(output_dir)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             self._error(f"Output directory does not exist: {output_dir}")
         
         if not os.access(output_dir, os.W_OK):
             self._error(f"Output directory is not writable: {output_dir}")
         
-        if not output_path.lower().endswith('.pdf'):
+        if Path(output_path).suffix.lower() != '.pdf':
             self._error(f"Output file must be a PDF file: {output_path}")
     
     def _error(self, message):
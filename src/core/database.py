@@ -1,14 +1,23 @@
-from sqlalchemy import create_engine, Column, Text
+from sqlalchemy import create_engine, Column, Text, select
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import NullPool
+from sqlalchemy.exc import SQLAlchemyError
 from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote
 import os
+import sqlite3
 import sys
 
 # Create base class for ORM models
 Base = declarative_base()
 
 
+class HashDatabaseError(Exception):
+    """Raised when reading the hash stream fails after the query has started"""
+
+
 class DatabaseConnection:
     """Database connection manager for SQLite databases"""
     
@@ -16,36 +25,45 @@ class DatabaseConnection:
         self.db_path = db_path
         self.engine = None
         self.session_factory = None
+        self.connected = False
     
     def connect(self):
-        """Establish connection to the database"""
+        """Validate the database file, the engine is created lazily by get_session()"""
         try:
             # Validate database file exists
             if not os.path.exists(self.db_path):
                 raise FileNotFoundError(f"Database file not found: {self.db_path}")
             
-            # Create SQLAlchemy engine
-            db_url = f"sqlite:///{self.db_path}"
-            self.engine = create_engine(
-                db_url,
-                echo=False,  # Set to True for SQL debugging
-                connect_args={"check_same_thread": False}  # For SQLite threading
-            )
-            
-            # Create session factory
-            self.session_factory = sessionmaker(bind=self.engine)
-            
+            self.connected = True
             return True
             
         except Exception as e:
             print(f"Error connecting to database: {e}", file=sys.stderr)
             return False
     
+    def _create_engine(self):
+        """Create the SQLAlchemy engine and session factory"""
+        # Open read-only and immutable, the hash database is never modified while scanning
+        db_uri = f"file:{quote(self.db_path)}?mode=ro&immutable=1"
+        self.engine = create_engine(
+            "sqlite://",
+            echo=False,  # Set to True for SQL debugging
+            poolclass=NullPool,  # Single short-lived session, no pooling needed
+            # check_same_thread=False for SQLite threading
+            creator=lambda: sqlite3.connect(db_uri, uri=True, check_same_thread=False)
+        )
+        
+        # Create session factory
+        self.session_factory = sessionmaker(bind=self.engine)
+    
     def get_session(self) -> Session:
         """Get a new database session"""
-        if not self.session_factory:
+        if not self.connected:
             raise RuntimeError("Database connection not established. Call connect() first.")
         
+        if not self.session_factory:
+            self._create_engine()
+        
         return self.session_factory()
     
     def close(self):
@@ -98,12 +116,42 @@ def create_database_session(db_path: str) -> Session:
     db_conn = open_database(db_path)
     return db_conn.get_session()
 
-def get_hashes() -> list[str]:
-    """Get all hashes from the VIC_HASHES table."""
+# Number of rows fetched from the database per round trip
+HASH_FETCH_SIZE = 10000
+
+def get_hashes() -> Iterator[str]:
+    """
+    Stream all distinct hashes from the VIC_HASHES table.
+    
+    The query runs immediately, so errors opening the database are raised
+    here. Rows are then fetched in batches of HASH_FETCH_SIZE while the
+    iterator is consumed, errors from that point on are raised by the
+    iterator as HashDatabaseError. The session is closed once it is exhausted.
+    """
     session = create_database_session("test_files/hashes.db")
-    result = session.query(VicHashes).all()
-    # contvert to list of hash values (strings)
-    return [str(row.hash_value) for row in result]
+    try:
+        # Select only the column and stream it, no ORM objects are built per row
+        stmt = select(VicHashes.hash_value).execution_options(yield_per=HASH_FETCH_SIZE)
+        result = session.scalars(stmt)
+    except Exception:
+        session.close()
+        raise
+    return _stream_hashes(session, result)
+
+def _stream_hashes(session: Session, result) -> Iterator[str]:
+    """
+    Yield the hashes of a query result and close its session afterwards.
+    
+    Rows are fetched while the caller iterates, so database errors surface
+    there and are raised as HashDatabaseError.
+    """
+    try:
+        for hash_value in result:
+            yield str(hash_value)
+    except SQLAlchemyError as e:
+        raise HashDatabaseError(e) from e
+    finally:
+        session.close()
 
 class VicHashes(Base):
     __tablename__ = 'VIC_HASHES'
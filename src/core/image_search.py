@@ -1,31 +1,90 @@
 import pytsk3
-from pathlib import Path
+import hashlib
 import time
 import datetime
 from core.logger import get_logger
 from core.models import Finding
 from typing import List
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import multiprocessing
+import os
+import ssl
 import sys
+import threading
 
-FOUND_FILES = 0
-SEARCHED_FILES = 0
-STOP_LOGGING = False
+# Read files in 1 MiB chunks while hashing
+CHUNK_SIZE = 1 << 20
+# Files up to this size are read with a single read_random call
+SMALL_FILE_SIZE = 64 * 1024
+
+# Number of files handed to a worker at once
+BATCH_SIZE = 64
+MAX_WORKERS = os.cpu_count() or 1
+# Threads overlapping libtsk reads with hashing when no process pool is used
+IO_THREADS = 4
+# The search pool is started while the progress thread is running, forking then could copy held locks
+POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Hex digest length -> hashlib algorithm name
+DIGEST_ALGORITHMS = {32: "md5", 40: "sha1", 64: "sha256"}
+
+# Digests of empty data, so empty files are matched without reading or hashing
+EMPTY_DIGESTS = {algorithm: hashlib.new(algorithm).digest() for algorithm in DIGEST_ALGORITHMS.values()}
+
+@dataclass
+class SearchStats:
+    """Search progress counters shared between the search and the stats display."""
+    found_files: int = 0
+    searched_files: int = 0
+    stopped: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _changed: threading.Event = field(default_factory=threading.Event, repr=False)
+    
+    def reset(self):
+        """Clear counters before a new search."""
+        with self._lock:
+            self.found_files = 0
+            self.searched_files = 0
+            self.stopped = False
+        self._changed.clear()
+    
+    def add(self, searched, found):
+        """Add processed files and matches, and wake up the stats display."""
+        with self._lock:
+            self.searched_files += searched
+            self.found_files += found
+        self._changed.set()
+    
+    def stop(self):
+        """Signal the stats display to finish."""
+        self.stopped = True
+        self._changed.set()
+    
+    def wait_for_update(self, timeout):
+        """Block until counters change or timeout expires, return (found, searched)."""
+        if not self.stopped:
+            self._changed.wait(timeout)
+        self._changed.clear()
+        with self._lock:
+            return self.found_files, self.searched_files
+
+SEARCH_STATS = SearchStats()
 
 def run_search_with_logging(image_path, hashes):
-    import time
-    global STOP_LOGGING
     start_time = time.time()
-    STOP_LOGGING = False
+    SEARCH_STATS.reset()
 
     with ThreadPoolExecutor(max_workers=2) as executor:
         f1 = executor.submit(search_image_for_hashes, image_path, hashes)
         f2 = executor.submit(log_stats, start_time)
 
-        result = f1.result()  # blocks until done
-        STOP_LOGGING = True   # signal logger thread to stop
-        f2.result()           # wait for it to finish cleanly
-        return result
+        try:
+            return f1.result()  # blocks until done
+        finally:
+            SEARCH_STATS.stop()  # signal logger thread to stop
+            f2.result()          # wait for it to finish cleanly
 
 def search_image_for_hashes(image_path, hashes) -> List[Finding]:
     """
@@ -33,7 +92,7 @@ def search_image_for_hashes(image_path, hashes) -> List[Finding]:
     
     Args:
         image_path (str): Path to the disk image file.
-        hashes (set): Set of hash values to search for.
+        hashes (Iterable[str]): Hash values to search for, consumed once.
         
     Returns:
         List[Finding]: List of findings containing matched files and their metadata.
@@ -41,6 +100,17 @@ def search_image_for_hashes(image_path, hashes) -> List[Finding]:
     logger = get_logger()
     all_findings = []
     
+    log_hash_backend(logger)
+    
+    # Only compute the algorithms that actually occur in the hash database
+    targets = split_hashes_by_algorithm(hashes, logger)
+    logger.debug(f"Retrieved {sum(map(len, targets.values()))} usable hashes from the database.")
+    logger.info(f"Hash algorithms in database: {', '.join(sorted(targets)) or 'none'}")
+    if not targets:
+        # Without target hashes every file would be read in full for nothing
+        logger.warning("No usable hashes in the database, skipping the image search")
+        return all_findings
+    
     try:
         # Open the disk image
         img = pytsk3.Img_Info(image_path)
@@ -54,8 +124,10 @@ def search_image_for_hashes(image_path, hashes) -> List[Finding]:
                 logger.info(f"Searching partition at offset {partition.start}")
                 try:
                     # Create filesystem for this partition
-                    fs = pytsk3.FS_Info(img, offset=partition.start * volume.info.block_size)
-                    partition_findings = search_filesystem(fs, hashes, partition.start)
+                    fs_offset = partition.start * volume.info.block_size
+                    fs = pytsk3.FS_Info(img, offset=fs_offset)
+                    partition_findings = search_filesystem(fs, targets, partition.start,
+                                                           image_path=image_path, fs_offset=fs_offset)
                     all_findings.extend(partition_findings)
                 except Exception as e:
                     logger.error(f"Could not access filesystem on partition at offset {partition.start}: {e}")
@@ -63,7 +135,7 @@ def search_image_for_hashes(image_path, hashes) -> List[Finding]:
             # No partition table found, try as single filesystem
             logger.info("No partition table found, treating as single filesystem")
             fs = pytsk3.FS_Info(img)
-            partition_findings = search_filesystem(fs, hashes)
+            partition_findings = search_filesystem(fs, targets, image_path=image_path)
             all_findings.extend(partition_findings)
             
     except Exception as e:
@@ -71,22 +143,86 @@ def search_image_for_hashes(image_path, hashes) -> List[Finding]:
     
     return all_findings
 
-def walk_fs(fs, path="/"):
-    try:
-        directory = fs.open_dir(path)
-    except IOError:
-        return
-    for entry in directory:
-        if not hasattr(entry, "info") or not entry.info.name:
+def log_hash_backend(logger):
+    """Log whether hashlib uses the hardware accelerated OpenSSL implementations."""
+    backend = getattr(hashlib.sha256, "__name__", "")
+    if backend.startswith("openssl_"):
+        logger.debug(f"Hashing via OpenSSL backend: {ssl.OPENSSL_VERSION}")
+    else:
+        logger.warning(f"hashlib is not backed by OpenSSL ({backend}), hashing will be slow")
+
+def split_hashes_by_algorithm(hashes, logger):
+    """
+    Group target hashes into per-algorithm frozensets of raw digest bytes keyed by hashlib name.
+    
+    hashes may be any iterable, e.g. rows streamed from the database, and is consumed once.
+    """
+    targets = {}
+    debug = logger.is_debug()
+    for hash_value in hashes:
+        if debug:
+            logger.debug(f"Hash : {hash_value}")
+        algorithm = DIGEST_ALGORITHMS.get(len(hash_value))
+        if algorithm is None:
+            logger.warning(f"Ignoring hash with unsupported length: {hash_value}")
             continue
-        name = entry.info.name.name.decode(errors="ignore")
-        if name in [".", ".."] or name.startswith("$"):
+        try:
+            digest = bytes.fromhex(hash_value)
+        except ValueError:
+            logger.warning(f"Ignoring hash that is not valid hex: {hash_value}")
             continue
-        full_path = "/".join([path.strip("/"), name]).replace("//", "/")
-        if entry.info.meta and entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
-            yield from walk_fs(fs, "/" + full_path)
-        else:
-            yield "/" + full_path
+        targets.setdefault(algorithm, set()).add(digest)
+    return {algorithm: frozenset(digests) for algorithm, digests in targets.items()}
+
+def walk_fs(fs, path="/", open_lock=None):
+    """
+    Yield (path, inode) of all files below path, walking directories iteratively.
+    
+    The inode address lets files and subdirectories be opened directly,
+    without libtsk resolving their path again. It is None for entries
+    without metadata.
+    
+    Directories are only entered once per address, so entries pointing back
+    to an ancestor on a corrupted image cannot make the walk loop forever.
+    
+    When other threads open files on the same filesystem, open_lock is held
+    while a directory is opened and its entries are read, see process_files.
+    """
+    # Directory paths are kept without a trailing slash, the root is ""
+    stack = [(path.rstrip("/"), None)]
+    visited = set()
+    while stack:
+        current, inode = stack.pop()
+        try:
+            with open_lock or nullcontext():
+                directory = fs.open_dir(inode=inode) if inode is not None else fs.open_dir(current or "/")
+                if directory.info.addr in visited:
+                    continue
+                entries = list(directory)
+        except IOError:
+            continue
+        visited.add(directory.info.addr)
+        for entry in entries:
+            info = getattr(entry, "info", None)
+            if info is None:
+                continue
+            name_obj = info.name
+            if not name_obj:
+                continue
+            # Skip ".", ".." and NTFS system files on the raw bytes before decoding
+            raw_name = name_obj.name
+            if raw_name in (b".", b"..") or raw_name[:1] == b"$":
+                continue
+            name = raw_name.decode(errors="ignore")
+            full_path = current + "/" + name
+            meta = info.meta
+            if meta is None:
+                yield full_path, None
+            elif meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
+                if meta.addr not in visited:
+                    stack.append((full_path, meta.addr))
+            else:
+                yield full_path, meta.addr
 
 def extract_file_metadata(file_obj, file_path):
     """Extract metadata from a file object."""
@@ -108,20 +244,31 @@ def extract_file_metadata(file_obj, file_path):
     
     return size, file_name, created_time, modified_time, accessed_time
 
-def compute_file_hash(file_obj, size, hash_type="sha256"):
-    """Compute hash of file data based on specified hash type."""
-    import hashlib
-    
-    data = file_obj.read_random(0, size) if size else b""
-    
-    if hash_type == "sha256":
-        return hashlib.sha256(data).hexdigest()
-    elif hash_type == "md5":
-        return hashlib.md5(data).hexdigest()
-    elif hash_type == "sha1":
-        return hashlib.sha1(data).hexdigest()
-    else:
-        raise ValueError(f"Unsupported hash type: {hash_type}")
+def compute_hashes(file_obj, size, algorithms):
+    """Compute the requested raw digests of file data in a single read pass."""
+    if size == 0:
+        return {algorithm: EMPTY_DIGESTS[algorithm] for algorithm in algorithms}
+    
+    if size <= SMALL_FILE_SIZE:
+        # Small files dominate disk images, hash them from one read without any streaming setup
+        data = file_obj.read_random(0, size)
+        if len(data) != size:
+            raise IOError(f"Short read of {len(data)} bytes for file of {size} bytes")
+        return {algorithm: hashlib.new(algorithm, data).digest() for algorithm in algorithms}
+    
+    hashers = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    
+    # Stream the file in chunks so memory use stays bounded by CHUNK_SIZE
+    offset = 0
+    while offset < size:
+        buf = file_obj.read_random(offset, min(CHUNK_SIZE, size - offset))
+        if not buf:
+            raise IOError(f"Unexpected end of data at offset {offset} of {size}")
+        for hasher in hashers.values():
+            hasher.update(buf)
+        offset += len(buf)
+    
+    return {algorithm: hasher.digest() for algorithm, hasher in hashers.items()}
 
 def create_finding(file_hash, file_path, size, file_name, partition_offset, 
                   created_time, modified_time, accessed_time):
@@ -137,30 +284,34 @@ def create_finding(file_hash, file_path, size, file_name, partition_offset,
         accessed_time=accessed_time
     )
 
-def process_single_file(file_path, fs, hashes, partition_offset, logger):
-    """Process a single file and return a Finding if hash matches."""
+def process_single_file(file_path, inode, fs, targets, partition_offset, logger, open_lock=None):
+    """
+    Process a single file and return a Finding if hash matches.
+    
+    When several threads share one filesystem, open_lock serializes opening
+    the file with the other libtsk open calls, reading and hashing then run
+    concurrently.
+    """
     try:
-        logger.debug(f"Processing file: {file_path}")
-        file_obj = fs.open(file_path)
+        if logger.is_debug():
+            logger.debug(f"Processing file: {file_path}")
+        with open_lock or nullcontext():
+            file_obj = fs.open_meta(inode=inode) if inode is not None else fs.open(file_path)
         
         # Extract metadata
         size, file_name, created_time, modified_time, accessed_time = extract_file_metadata(file_obj, file_path)
         
-        # Compute hash
-        file_hash_sha265 = compute_file_hash(file_obj, size, hash_type="sha256")
-        file_hash_md5 = compute_file_hash(file_obj, size, hash_type="md5")
-        file_hash_sha1 = compute_file_hash(file_obj, size, hash_type="sha1")
-        
-        computed_hashes = {file_hash_sha265, file_hash_md5, file_hash_sha1}
-        target_hashes = set(hashes)  # ensure it's a set
+        # Compute the needed hashes in a single pass over the file data
+        computed_hashes = compute_hashes(file_obj, size, targets)
         
-        # Check if any computed hash matches any of the target hashes
-        matches = computed_hashes & target_hashes
-        if matches:
-            matched_hash = next(iter(matches))
+        # Check each computed hash against the targets of its algorithm
+        for algorithm, digest in computed_hashes.items():
+            if digest not in targets[algorithm]:
+                continue
+            matched_hash = digest.hex()
             logger.info(f"Found matching file for hash << {matched_hash[:5]}...{matched_hash[-5:]} >> at {file_path}")
             return create_finding(matched_hash, file_path, size, file_name, partition_offset,
-                      created_time, modified_time, accessed_time)
+                                  created_time, modified_time, accessed_time)
         
         return None
         
@@ -168,6 +319,86 @@ def process_single_file(file_path, fs, hashes, partition_offset, logger):
         logger.warning(f"Error processing file {file_path}: {e}")
         return None
 
+# Per-process state of the search workers, set up once by _init_worker
+_WORKER_FS = None
+_WORKER_TARGETS = None
+
+def _init_worker(image_path, fs_offset, targets, debug_mode):
+    """Open the image once per worker process, pytsk3 handles cannot be pickled."""
+    global _WORKER_FS, _WORKER_TARGETS
+    get_logger().set_debug_mode(debug_mode)
+    img = pytsk3.Img_Info(image_path)
+    _WORKER_FS = pytsk3.FS_Info(img, offset=fs_offset)
+    _WORKER_TARGETS = targets
+
+def _process_batch(files, fs, targets, partition_offset, logger, open_lock=None):
+    """Process a batch of (path, inode) files and return the findings."""
+    findings = []
+    for file_path, inode in files:
+        finding = process_single_file(file_path, inode, fs, targets, partition_offset, logger, open_lock)
+        if finding:
+            findings.append(finding)
+    return findings
+
+def _process_worker_batch(files, partition_offset):
+    """Process a batch of files inside a worker process."""
+    return _process_batch(files, _WORKER_FS, _WORKER_TARGETS, partition_offset, get_logger())
+
+def _batched(iterable, size):
+    """Yield lists of up to size items from iterable."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _submit_batches(executor, batches, max_pending, fn, *args):
+    """Submit fn(batch, *args) per batch and yield (len(batch), result) as they complete."""
+    pending = {}
+    for batch in batches:
+        # Bound the number of queued batches so the walk does not run far ahead
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+        pending[executor.submit(fn, batch, *args)] = len(batch)
+    
+    for future in list(pending):
+        yield pending.pop(future), future.result()
+
+def process_files(fs, targets, partition_offset, logger, image_path=None, fs_offset=0):
+    """
+    Hash all files of a filesystem and yield (processed_count, findings) per batch.
+    
+    Files are spread over a process pool when the image path is known and
+    several cores are available. Otherwise a thread pool shares the already
+    opened filesystem, overlapping libtsk reads with hashing since hashlib
+    releases the GIL while digesting.
+    
+    On the shared filesystem all libtsk open calls, the directory opens of the
+    walk on this thread and the file opens of the workers, are serialized by
+    one lock. Reads of already opened files run concurrently.
+    """
+    if image_path is None or MAX_WORKERS < 2:
+        open_lock = threading.Lock()
+        batches = _batched(walk_fs(fs, open_lock=open_lock), BATCH_SIZE)
+        with ThreadPoolExecutor(max_workers=IO_THREADS) as executor:
+            yield from _submit_batches(executor, batches, IO_THREADS * 4, _process_batch,
+                                       fs, targets, partition_offset, logger, open_lock)
+        return
+    
+    # Each worker process opens its own filesystem, so the walk needs no lock here
+    batches = _batched(walk_fs(fs), BATCH_SIZE)
+    debug_mode = logger.is_debug()
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                             initializer=_init_worker,
+                             initargs=(image_path, fs_offset, targets, debug_mode)) as executor:
+        yield from _submit_batches(executor, batches, MAX_WORKERS * 4, _process_worker_batch,
+                                   partition_offset)
+
 def report_progress(processed_files, matches_found, start_time, last_progress_time, 
                    progress_interval, logger):
     """Report search progress if enough time has elapsed."""
@@ -179,9 +410,8 @@ def report_progress(processed_files, matches_found, start_time, last_progress_ti
         return current_time
     return last_progress_time
 
-def search_filesystem(fs, hashes, partition_offset=None) -> List[Finding]:
+def search_filesystem(fs, targets, partition_offset=None, image_path=None, fs_offset=0) -> List[Finding]:
     """Search a filesystem for matching hashes and return findings."""
-    global FOUND_FILES, SEARCHED_FILES
     logger = get_logger()
     findings = []
     
@@ -193,18 +423,12 @@ def search_filesystem(fs, hashes, partition_offset=None) -> List[Finding]:
     
     logger.info("Starting filesystem search...")
     
-    for file_path in walk_fs(fs):
-        # Process the file
-        finding = process_single_file(file_path, fs, hashes, partition_offset, logger)
-        
-        if finding:
-            findings.append(finding)
-            matches_found += 1
-        
-        processed_files += 1
-
-        SEARCHED_FILES = processed_files
-        FOUND_FILES = matches_found
+    for batch_size, batch_findings in process_files(fs, targets, partition_offset, logger,
+                                                    image_path=image_path, fs_offset=fs_offset):
+        findings.extend(batch_findings)
+        matches_found += len(batch_findings)
+        processed_files += batch_size
+        SEARCH_STATS.add(batch_size, len(batch_findings))
         
         # Report progress periodically
         last_progress_time = report_progress(processed_files, matches_found, start_time, 
@@ -216,6 +440,8 @@ def search_filesystem(fs, hashes, partition_offset=None) -> List[Finding]:
     print("\n")
     logger.info(f"Search completed: {processed_files} files processed, {matches_found} matches found in {total_time:.1f}s (avg: {avg_rate:.1f} files/sec)")
     
+    # Batches complete in any order, sort so reports are reproducible
+    findings.sort(key=lambda finding: finding.file_path)
     return findings
 
 #### LOGGING ####
@@ -232,9 +458,13 @@ MAGENTA = "\033[35m"
 def format_number(n):
     return f"{n:,}"
 
+# Refresh the stats line at least this often so the elapsed time keeps ticking
+STATS_REFRESH_INTERVAL = 0.5
+# Minimum time between two redraws when updates arrive faster
+STATS_MIN_REDRAW_INTERVAL = 0.2
+
 def log_stats(start_time):
-    global FOUND_FILES, SEARCHED_FILES, STOP_LOGGING
-    time.sleep(0.5)
+    SEARCH_STATS.wait_for_update(STATS_REFRESH_INTERVAL)
     
     # Print table header once
     header = (
@@ -246,7 +476,9 @@ def log_stats(start_time):
     print("\n" + header)
     print(separator)
     
-    while not STOP_LOGGING:
+    while True:
+        stopped = SEARCH_STATS.stopped
+        found_files, searched_files = SEARCH_STATS.wait_for_update(STATS_REFRESH_INTERVAL)
         elapsed = time.time() - start_time
         elapsed_str = f"{int(elapsed//3600):02}:{int((elapsed%3600)//60):02}:{int(elapsed%60):02}"
         
@@ -254,12 +486,16 @@ def log_stats(start_time):
             f"{BOLD}{CYAN}||{RESET} "
             f"{YELLOW}{time.strftime('%H:%M:%S', time.localtime(start_time)):^10}{RESET} || "
             f"{MAGENTA}{elapsed_str:^10}{RESET} || "
-            f"{GREEN}{format_number(FOUND_FILES):^15}{RESET} || "
-            f"{RED}{format_number(SEARCHED_FILES):^15}{RESET} ||"
+            f"{GREEN}{format_number(found_files):^15}{RESET} || "
+            f"{RED}{format_number(searched_files):^15}{RESET} ||"
         )
         
         # Overwrite previous line
         sys.stdout.write(f"\r{line}")
         sys.stdout.flush()
-        time.sleep(0.2)
+        
+        # Draw the final counters once more after the search has finished
+        if stopped:
+            break
+        time.sleep(STATS_MIN_REDRAW_INTERVAL)
     print("\n")
\ No newline at end of file
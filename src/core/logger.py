@@ -42,6 +42,10 @@ class Logger:
         for handler in self._logger.handlers:
             handler.setLevel(level)
     
+    def is_debug(self):
+        """Return True if debug messages are emitted."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+    
     def get_logger(self):
         """Get the logger instance."""
         return self._logger
@@ -62,7 +66,10 @@ class Logger:
         """Log warning message."""
         self._logger.warning(message)
 
+# Module-level singleton, created once on import so lookups skip Logger.__init__
+LOGGER = Logger()
+
 # Convenience function to get logger instance
 def get_logger():
     """Get the singleton logger instance."""
-    return Logger()
+    return LOGGER
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import datetime
 
@@ -15,6 +15,11 @@ class Finding:
     created_time: Optional[datetime.datetime] = None
     modified_time: Optional[datetime.datetime] = None
     accessed_time: Optional[datetime.datetime] = None
+    # Truncated hash for table display, derived once from hash_value
+    hash_value_short: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.hash_value_short = self.hash_value[:16] + '…'
     
     def __str__(self):
         return f"Finding(hash={self.hash_value[:8]}..., path={self.file_path}, size={self.file_size})"
@@ -5,12 +5,134 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from core.models import Finding
 from core.logger import get_logger
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import functools
 import hashlib
+import io
+import multiprocessing
 import os
 
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pypdf is optional, without it reports are rendered sequentially
+    PdfReader = PdfWriter = None
+
+# rl_accel silently falls back to pure Python when the _rl_accel C extension is not installed
+from reportlab.lib import rl_accel
+RL_ACCEL_AVAILABLE = bool(rl_accel._c_funcs)
+
+# Fixed row heights let ReportLab skip measuring every table row
+METADATA_ROW_HEIGHT = 0.8*cm
+FINDINGS_HEADER_HEIGHT = 0.8*cm
+FINDINGS_ROW_HEIGHT = 0.7*cm
+
+# Findings per table, large tables are split so ReportLab builds several small ones
+FINDINGS_CHUNK_SIZE = 200
+
+# Large reports render their findings chunks in parallel worker processes
+PARALLEL_REPORT_MIN_FINDINGS = 500
+REPORT_WORKERS = os.cpu_count() or 1
+# Same start method as the search pool, workers do not inherit the parent's threads or locks
+REPORT_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Write buffer for the output file, so the PDF reaches disk in large blocks
+REPORT_WRITE_BUFFER = 1024 * 1024
+
+# Timestamp format of the report, the overview table shows it without seconds
+TIMESTAMP_FORMAT = '%d.%m.%Y %H:%M:%S'
+TIMESTAMP_MINUTES_LENGTH = len('dd.mm.yyyy hh:mm')
+
+# Detail table layout, cells hold plain text so no paragraph parsing is needed
+DETAIL_FONT_SIZE = 8
+DETAIL_LEADING = 10
+DETAIL_PADDING = 4
+# Characters per line that fit the value column in Courier at DETAIL_FONT_SIZE
+DETAIL_LINE_CHARS = 80
+# Table rows cannot be split across pages, longer findings continue in further rows.
+# 60 lines keep a row well below the height of the page frame.
+DETAIL_MAX_ROW_LINES = 60
+
+# Table styles are immutable once built, so all reports share them
+_METADATA_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+_FINDINGS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+_DETAIL_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Courier'),
+    ('FONTSIZE', (0, 0), (-1, -1), DETAIL_FONT_SIZE),
+    ('LEADING', (0, 0), (-1, -1), DETAIL_LEADING),
+    ('TOPPADDING', (0, 0), (-1, -1), DETAIL_PADDING),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), DETAIL_PADDING),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+])
+
+@functools.cache
+def _paragraph_styles():
+    """Build the report paragraph styles once per process."""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.black
+    )
+    
+    # Header style
+    header_style = ParagraphStyle(
+        'CustomHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=12,
+        spaceBefore=20,
+        textColor=colors.black
+    )
+    
+    # Body style
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        alignment=TA_LEFT
+    )
+    
+    # Evidence style
+    evidence_style = ParagraphStyle(
+        'EvidenceStyle',
+        parent=styles['Normal'],
+        fontSize=9,
+        fontName='Courier',
+        spaceAfter=4,
+        leftIndent=20
+    )
+    
+    return title_style, header_style, body_style, evidence_style
+
 class ForensicReportGenerator:
     """
     Generates professional forensic reports suitable for legal proceedings.
@@ -19,57 +141,19 @@ class ForensicReportGenerator:
     
     def __init__(self):
         self.logger = get_logger()
-        self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
     
     def _setup_custom_styles(self):
         """Setup custom paragraph styles for the report."""
-        # Title style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.black
-        )
-        
-        # Header style
-        self.header_style = ParagraphStyle(
-            'CustomHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=colors.black
-        )
-        
-        # Body style
-        self.body_style = ParagraphStyle(
-            'CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=6,
-            alignment=TA_LEFT
-        )
-        
-        # Evidence style
-        self.evidence_style = ParagraphStyle(
-            'EvidenceStyle',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            fontName='Courier',
-            spaceAfter=4,
-            leftIndent=20
-        )
+        self.title_style, self.header_style, self.body_style, self.evidence_style = _paragraph_styles()
     
-    def generate_report(self, findings: List[Finding], investigator_name: str, 
+    def generate_report(self, findings: Iterable[Finding], investigator_name: str, 
                        evidence_path: str, output_path: str, case_number: Optional[str] = None) -> str:
         """
         Generate a comprehensive forensic report from findings.
         
         Args:
-            findings: List of Finding objects
+            findings: Finding objects, any iterable is consumed exactly once
             investigator_name: Name of the investigating officer/expert
             evidence_path: Path to the evidence image
             output_path: Output file path for the PDF
@@ -78,108 +162,198 @@ class ForensicReportGenerator:
         Returns:
             str: Path to the generated PDF file
         """
+        findings = list(findings)
         self.logger.info(f"Generating forensic report with {len(findings)} findings")
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm
-        )
-        
-        # Build the story (content)
+        if not RL_ACCEL_AVAILABLE:
+            self.logger.warning("ReportLab C accelerator not found, rendering will be slower. "
+                                "Install it with: pip install rl_accel")
+        
+        # Stat the evidence once, the sections below only use these values
+        evidence_name = os.path.basename(evidence_path)
+        evidence_stats = self._stat_evidence(evidence_path)
+        # One timestamp for the header and the signature date
+        report_time = datetime.now()
+        
+        if self._use_parallel_rendering(findings):
+            self._generate_report_parallel(findings, investigator_name, evidence_path, evidence_name,
+                                           evidence_stats, report_time, output_path, case_number)
+            self.logger.debug(f"Forensic report generated: {output_path}")
+            return output_path
+        
+        # Build the story (content), every section appends its flowables to it
         story = []
         
         # Add header and metadata
-        story.extend(self._create_header(investigator_name, evidence_path, case_number))
+        self._create_header(story, investigator_name, evidence_path, evidence_name, report_time, case_number)
         
         # Add executive summary
-        story.extend(self._create_executive_summary(findings, evidence_path))
+        self._create_executive_summary(story, findings, evidence_name)
         
         # Add methodology section
-        story.extend(self._create_methodology_section())
+        self._create_methodology_section(story)
         
         # Add findings section
-        story.extend(self._create_findings_section(findings))
+        self._create_findings_section(story, findings)
         
         # Add technical details
-        story.extend(self._create_technical_section(evidence_path))
+        self._create_technical_section(story, evidence_path, evidence_stats)
         
         # Add signature section
-        story.extend(self._create_signature_section(investigator_name))
+        self._create_signature_section(story, investigator_name, report_time)
         
         # Build the PDF
-        doc.build(story)
+        self._write_output(output_path, lambda output_file: self._build_pdf(story, output_file))
         
         self.logger.debug(f"Forensic report generated: {output_path}")
         return output_path
     
-    def _create_header(self, investigator_name: str, evidence_path: str, case_number: Optional[str] = None):
-        """Create the report header section."""
-        story = []
+    def _stat_evidence(self, evidence_path: str) -> Optional[os.stat_result]:
+        """Return the stat result of the evidence file, or None if it cannot be read."""
+        try:
+            return os.stat(evidence_path)
+        except OSError as e:
+            self.logger.warning(f"Could not read evidence file metadata for {evidence_path}: {e}")
+            return None
+    
+    def _use_parallel_rendering(self, findings: List[Finding]) -> bool:
+        """Return True if the findings section should be rendered by worker processes."""
+        return (PdfWriter is not None and REPORT_WORKERS > 1
+                and len(findings) >= PARALLEL_REPORT_MIN_FINDINGS)
+    
+    def _generate_report_parallel(self, findings: List[Finding], investigator_name: str,
+                                  evidence_path: str, evidence_name: str,
+                                  evidence_stats: Optional[os.stat_result], report_time: datetime, output_path: str,
+                                  case_number: Optional[str] = None):
+        """
+        Render the findings chunks in worker processes and merge all parts into one PDF.
         
+        Every part is a separate document, so each chunk starts on a new page.
+        """
+        chunks = [(start, findings[start:start + FINDINGS_CHUNK_SIZE])
+                  for start in range(0, len(findings), FINDINGS_CHUNK_SIZE)]
+        
+        # The first chunk is rendered here, start no more workers than there are remaining chunks
+        workers = min(REPORT_WORKERS, len(chunks) - 1)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context(REPORT_POOL_START_METHOD)) as executor:
+            futures = [executor.submit(_render_findings_chunk, start, chunk) for start, chunk in chunks[1:]]
+            
+            # Render the first chunk, front matter and closing sections here while the workers run.
+            # Front matter ends with the first overview table, so the section intro is not left alone on a page.
+            head = []
+            self._create_header(head, investigator_name, evidence_path, evidence_name, report_time, case_number)
+            self._create_executive_summary(head, findings, evidence_name)
+            self._create_methodology_section(head)
+            self._create_findings_intro(head, findings)
+            
+            details = []
+            self._create_details_heading(details)
+            self._create_findings_tables(chunks[0][1], chunks[0][0], head, details)
+            
+            head_part = self._render_to_bytes(head)
+            details_part = self._render_to_bytes(details)
+            
+            tail = []
+            self._create_technical_section(tail, evidence_path, evidence_stats)
+            self._create_signature_section(tail, investigator_name, report_time)
+            tail_part = self._render_to_bytes(tail)
+            
+            chunk_parts = [future.result() for future in futures]
+        
+        parts = [head_part]
+        parts.extend(overview_part for overview_part, _ in chunk_parts)
+        parts.append(details_part)
+        parts.extend(chunk_details_part for _, chunk_details_part in chunk_parts)
+        parts.append(tail_part)
+        
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(PdfReader(io.BytesIO(part)))
+        self._write_output(output_path, writer.write)
+    
+    def _write_output(self, output_path: str, write):
+        """
+        Call write(file) on a temporary file next to output_path and move it into place.
+        
+        The file is written with a large buffer and synced to disk first, so output_path
+        only ever holds a complete report. If write fails, no file is left behind.
+        """
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb", buffering=REPORT_WRITE_BUFFER) as output_file:
+                write(output_file)
+                output_file.flush()
+                os.fsync(output_file.fileno())
+            os.replace(temp_path, output_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+    
+    def _build_pdf(self, story, output):
+        """Lay out the story into a PDF written to output, a path or a binary file object."""
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            rightMargin=2*cm,
+            leftMargin=2*cm,
+            topMargin=2*cm,
+            bottomMargin=2*cm
+        )
+        doc.build(story)
+    
+    def _render_to_bytes(self, story) -> bytes:
+        """Render a story to an in-memory PDF."""
+        buffer = io.BytesIO()
+        self._build_pdf(story, buffer)
+        return buffer.getvalue()
+    
+    def _create_header(self, story: list, investigator_name: str, evidence_path: str, evidence_name: str,
+                       report_time: datetime, case_number: Optional[str] = None):
+        """Create the report header section."""
         # Main title
         story.append(Paragraph("DIGITALES FORENSIK-GUTACHTEN", self.title_style))
         story.append(Paragraph("Hash-Analyse Bericht", self.title_style))
         story.append(Spacer(1, 20))
         
-        # Metadata table
-        current_time = datetime.now()
-        
-        metadata = [
-            ['Berichtsdatum:', current_time.strftime('%d.%m.%Y %H:%M:%S Uhr')],
+        # Metadata table, the case number row is only present if one was given
+        metadata = [row for row in (
+            ['Berichtsdatum:', report_time.strftime(f'{TIMESTAMP_FORMAT} Uhr')],
+            ['Aktenzeichen:', case_number] if case_number else None,
             ['Gutachter/Ermittler:', investigator_name],
-            ['Asservat-Pfad:', os.path.basename(evidence_path)],
+            ['Asservat-Pfad:', evidence_name],
             ['Vollständiger Pfad:', evidence_path],
-        ]
+        ) if row is not None]
         
-        if case_number:
-            metadata.insert(1, ['Aktenzeichen:', case_number])
-        
-        metadata_table = Table(metadata, colWidths=[4*cm, 12*cm])
-        metadata_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        metadata_table = Table(metadata, colWidths=[4*cm, 12*cm],
+                               rowHeights=[METADATA_ROW_HEIGHT] * len(metadata))
+        metadata_table.setStyle(_METADATA_TABLE_STYLE)
         
         story.append(metadata_table)
         story.append(Spacer(1, 30))
-        
-        return story
     
-    def _create_executive_summary(self, findings: List[Finding], evidence_path: str):
+    def _create_executive_summary(self, story: list, findings: List[Finding], evidence_name: str):
         """Create executive summary section."""
-        story = []
-        
         story.append(Paragraph("1. ZUSAMMENFASSUNG", self.header_style))
         
         summary_text = f"""
         Dieser Bericht dokumentiert die Ergebnisse einer digitalen forensischen Analyse 
-        des Datenträger-Images '{os.path.basename(evidence_path)}'. Die Untersuchung 
+        des Datenträger-Images '{evidence_name}'. Die Untersuchung 
         erfolgte mittels Hash-Wert-Abgleich gegen eine Referenzdatenbank bekannter 
         Dateien.
         
         <b>Ergebnis der Analyse:</b><br/>
         • Anzahl gefundener relevanter Dateien: {len(findings)}<br/>
-        • Analysiertes Datenträger-Image: {os.path.basename(evidence_path)}<br/>
+        • Analysiertes Datenträger-Image: {evidence_name}<br/>
         • Verwendete Methodik: SHA-256 Hash-Wert-Abgleich<br/>
         • Integrität der Beweismittel: Gewährleistet durch unveränderliche Hash-Werte
         """
         
         story.append(Paragraph(summary_text, self.body_style))
         story.append(Spacer(1, 20))
-        
-        return story
     
-    def _create_methodology_section(self):
+    def _create_methodology_section(self, story: list):
         """Create methodology section."""
-        story = []
-        
         story.append(Paragraph("2. METHODIK UND VERFAHREN", self.header_style))
         
         methodology_text = """
@@ -201,12 +375,28 @@ class ForensicReportGenerator:
         
         story.append(Paragraph(methodology_text, self.body_style))
         story.append(Spacer(1, 20))
-        
-        return story
     
-    def _create_findings_section(self, findings: List[Finding]):
+    def _create_findings_section(self, story: list, findings: List[Finding]):
         """Create detailed findings section."""
-        story = []
+        self._create_findings_intro(story, findings)
+        if not findings:
+            return
+        
+        # Overview tables go straight into the story, detail tables follow after all of them
+        details = []
+        for start in range(0, len(findings), FINDINGS_CHUNK_SIZE):
+            if start:
+                story.append(PageBreak())
+            self._create_findings_tables(findings[start:start + FINDINGS_CHUNK_SIZE], start, story, details)
+        
+        story.append(Spacer(1, 20))
+        
+        # Add detailed findings as tables with a row per finding
+        self._create_details_heading(story)
+        story.extend(details)
+    
+    def _create_findings_intro(self, story: list, findings: List[Finding]):
+        """Create the heading and introduction of the findings section."""
         # Next page for findings
         story.append(PageBreak())
         
@@ -218,7 +408,7 @@ class ForensicReportGenerator:
                 "der Referenzdatenbank übereinstimmen.",
                 self.body_style
             ))
-            return story
+            return
         
         story.append(Paragraph(
             f"Die folgenden {len(findings)} Dateien wurden identifiziert und "
@@ -226,75 +416,90 @@ class ForensicReportGenerator:
             self.body_style
         ))
         story.append(Spacer(1, 10))
+    
+    def _create_findings_tables(self, chunk: List[Finding], start: int, overview: list, details: list):
+        """
+        Create the overview and detail tables for a chunk of findings numbered from start + 1.
         
-        # Create findings table
+        Both tables are filled in the same loop, so each finding is visited once.
+        The overview table is appended to overview, the detail table to details.
+        """
         table_data = [['Nr.', 'Dateiname', 'Größe (Bytes)', 'SHA-256 Hash', 'Änderungsdatum']]
+        detail_rows = []
+        detail_heights = []
         
-        for i, finding in enumerate(findings, 1):
-            modified_date = finding.modified_time.strftime('%d.%m.%Y %H:%M') if finding.modified_time else 'N/A'
+        for i, finding in enumerate(chunk, start + 1):
+            # Format size and modification time once for both tables
+            size_str = f"{finding.file_size:,}"
+            modified_str = finding.modified_time.strftime(TIMESTAMP_FORMAT) if finding.modified_time else None
             
             table_data.append([
                 str(i),
                 finding.file_name,
-                f"{finding.file_size:,}",
-                finding.hash_value[:16] + '...',
-                modified_date
+                size_str,
+                finding.hash_value_short,
+                modified_str[:TIMESTAMP_MINUTES_LENGTH] if modified_str else 'N/A'
             ])
-        
-        findings_table = Table(table_data, colWidths=[1*cm, 3*cm, 4*cm, 2*cm, 3*cm, 2.5*cm])
-        findings_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-        
-        story.append(findings_table)
-        story.append(Spacer(1, 20))
-        
-        # Add detailed findings
+            
+            lines = self._finding_detail_lines(finding, size_str, modified_str)
+            for row_start in range(0, len(lines), DETAIL_MAX_ROW_LINES):
+                row_lines = lines[row_start:row_start + DETAIL_MAX_ROW_LINES]
+                label = f"Fund Nr. {i}" if row_start == 0 else "(Forts.)"
+                detail_rows.append([label, "\n".join(row_lines)])
+                # Known line count, so ReportLab does not have to measure the row
+                detail_heights.append(len(row_lines) * DETAIL_LEADING + 2 * DETAIL_PADDING)
+        
+        row_heights = [FINDINGS_HEADER_HEIGHT] + [FINDINGS_ROW_HEIGHT] * len(chunk)
+        findings_table = Table(table_data, colWidths=[1*cm, 5*cm, 3*cm, 4.5*cm, 3.5*cm],
+                               rowHeights=row_heights, repeatRows=1)
+        findings_table.setStyle(_FINDINGS_TABLE_STYLE)
+        
+        detail_table = Table(detail_rows, colWidths=[2.5*cm, 14.5*cm], rowHeights=detail_heights)
+        detail_table.setStyle(_DETAIL_TABLE_STYLE)
+        
+        overview.append(findings_table)
+        details.append(detail_table)
+    
+    def _create_details_heading(self, story: list):
+        """Create the heading of the detailed findings subsection."""
         story.append(Paragraph("3.1 Detaillierte Fundstellen", self.header_style))
+    
+    def _finding_detail_lines(self, finding: Finding, size_str: str, modified_str: Optional[str]) -> List[str]:
+        """
+        Format the details of a finding as plain text lines wrapped to the detail column.
         
-        for i, finding in enumerate(findings, 1):
-            story.append(Paragraph(f"<b>Fund Nr. {i}:</b>", self.body_style))
-            
-            details = f"""
-            Dateiname: {finding.file_name}<br/>
-            Vollständiger Pfad: {finding.file_path}<br/>
-            Dateigröße: {finding.file_size:,} Bytes<br/>
-            SHA-256 Hash: {finding.hash_value}<br/>
-            """
-            
-            if finding.created_time:
-                details += f"Erstellungsdatum: {finding.created_time.strftime('%d.%m.%Y %H:%M:%S')}<br/>"
-            if finding.modified_time:
-                details += f"Änderungsdatum: {finding.modified_time.strftime('%d.%m.%Y %H:%M:%S')}<br/>"
-            if finding.accessed_time:
-                details += f"Zugriffsdatum: {finding.accessed_time.strftime('%d.%m.%Y %H:%M:%S')}<br/>"
-            if finding.partition_offset:
-                details += f"Partition Offset: {finding.partition_offset}<br/>"
-            
-            story.append(Paragraph(details, self.evidence_style))
-            story.append(Spacer(1, 10))
+        size_str and modified_str are the already formatted size and modification time.
+        """
+        details = [
+            f"Dateiname: {finding.file_name}",
+            f"Vollständiger Pfad: {finding.file_path}",
+            f"Dateigröße: {size_str} Bytes",
+            f"SHA-256 Hash: {finding.hash_value}",
+        ]
         
-        return story
+        if finding.created_time:
+            details.append(f"Erstellungsdatum: {finding.created_time.strftime(TIMESTAMP_FORMAT)}")
+        if modified_str:
+            details.append(f"Änderungsdatum: {modified_str}")
+        if finding.accessed_time:
+            details.append(f"Zugriffsdatum: {finding.accessed_time.strftime(TIMESTAMP_FORMAT)}")
+        if finding.partition_offset:
+            details.append(f"Partition Offset: {finding.partition_offset}")
+        
+        # Hard wrap without dropping characters, paths and hashes must stay complete
+        lines = []
+        for detail in details:
+            lines.extend(detail[i:i + DETAIL_LINE_CHARS] for i in range(0, len(detail), DETAIL_LINE_CHARS))
+        return lines
     
-    def _create_technical_section(self, evidence_path: str):
+    def _create_technical_section(self, story: list, evidence_path: str, evidence_stats: Optional[os.stat_result]):
         """Create technical details section."""
-        story = []
-        
         story.append(Paragraph("4. TECHNISCHE DETAILS", self.header_style))
         
-        # Get file stats
-        try:
-            file_stats = os.stat(evidence_path)
-            file_size = file_stats.st_size
-            file_modified = datetime.fromtimestamp(file_stats.st_mtime)
-        except:
+        if evidence_stats is not None:
+            file_size = evidence_stats.st_size
+            file_modified = datetime.fromtimestamp(evidence_stats.st_mtime)
+        else:
             file_size = 0
             file_modified = datetime.now()
         
@@ -318,13 +523,9 @@ class ForensicReportGenerator:
         
         story.append(Paragraph(technical_details, self.body_style))
         story.append(Spacer(1, 20))
-        
-        return story
     
-    def _create_signature_section(self, investigator_name: str):
+    def _create_signature_section(self, story: list, investigator_name: str, report_time: datetime):
         """Create signature and certification section."""
-        story = []
-        
         story.append(Paragraph("5. BESTÄTIGUNG UND UNTERSCHRIFT", self.header_style))
         
         signature_text = f"""
@@ -337,7 +538,7 @@ class ForensicReportGenerator:
         anerkannt und gerichtsverwertbar.
         
         <br/><br/>
-        Ort, Datum: _________________, {datetime.now().strftime('%d.%m.%Y')}
+        Ort, Datum: _________________, {report_time.strftime('%d.%m.%Y')}
         
         <br/><br/><br/>
         ________________________________<br/>
@@ -346,16 +547,22 @@ class ForensicReportGenerator:
         """
         
         story.append(Paragraph(signature_text, self.body_style))
-        
-        return story
 
-def generate_forensic_report(findings: List[Finding], investigator_name: str, 
+def _render_findings_chunk(start: int, chunk: List[Finding]):
+    """Render the overview and detail tables of one findings chunk in a worker process."""
+    generator = ForensicReportGenerator()
+    overview = []
+    details = []
+    generator._create_findings_tables(chunk, start, overview, details)
+    return generator._render_to_bytes(overview), generator._render_to_bytes(details)
+
+def generate_forensic_report(findings: Iterable[Finding], investigator_name: str, 
                            evidence_path: str, output_path: str, case_number: Optional[str] = None) -> str:
     """
     Convenience function to generate a forensic report.
     
     Args:
-        findings: List of Finding objects
+        findings: Finding objects, any iterable is consumed exactly once
         investigator_name: Name of the investigating officer/expert
         evidence_path: Path to the evidence image
         output_path: Output file path for the PDF
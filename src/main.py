@@ -1,10 +1,10 @@
 from core.arg_parser import parse_arguments
-from core.database import get_hashes
+from core.database import get_hashes, HashDatabaseError
 from core.logger import get_logger
-from core.image_search import search_image_for_hashes, run_search_with_logging
-from core.pdf_generator import generate_forensic_report
+from core.image_search import run_search_with_logging
 import sys
 import os
+from pathlib import Path
 from core.ascii_art import print_ascii_art
 
 def print_params(evidence_path, hash_db_path, investigator_name, output_path, logger):
@@ -35,35 +35,40 @@ def main():
     print_params(evidence_path, hash_db_path, investigator_name, output_path, logger)
     
     try:
+        # Hashes are streamed from the database while the search builds its lookup sets
         hashes = get_hashes()
-        logger.debug(f"Retrieved {len(hashes)} records from VIC_HASHES table.")
-        for record in hashes:
-            logger.debug(f"Hash : {record}")
     except Exception as e:
         logger.error(f"Failed to retrieve hashes from database: {e}")
         return 1
     
-    # wait for user to press enter
-    input("\n\nPlease check your parameters, then press Enter to start the forensic analysis.\n")
+    # wait for user to press enter, unless confirmed up front or not run interactively
+    if not args.yes and sys.stdin.isatty():
+        input("\n\nPlease check your parameters, then press Enter to start the forensic analysis.\n")
 
     # Perform the forensic search
     logger.info("Starting forensic analysis...")
-    findings = run_search_with_logging(evidence_path, hashes)
+    try:
+        findings = run_search_with_logging(evidence_path, hashes)
+    except HashDatabaseError as e:
+        # The hashes are read from the database while the search starts up
+        logger.error(f"Failed to retrieve hashes from database: {e}")
+        return 1
     
     logger.info(f"Analysis completed. Found {len(findings)} matching files.")
     
     # Generate the forensic report
     try:
         # Ensure output path has .pdf extension
-        if not output_path.lower().endswith('.pdf'):
+        if Path(output_path).suffix.lower() != '.pdf':
             output_path = output_path + '.pdf'
         
         # Ensure output directory exists
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
-        # Generate PDF report
+        # Generate PDF report, reportlab is only imported once there is something to report
+        from core.pdf_generator import generate_forensic_report
         report_path = generate_forensic_report(
             findings=findings,
             investigator_name=investigator_name,